@@ -674,28 +674,6 @@ def generate_audio(
         user_feedback=user_feedback_processed
     )
 
-    # Generate audio from the transcript
-    audio = b""
-    transcript = ""
-    characters = 0
-
-    with cf.ThreadPoolExecutor() as executor:
-        futures = []
-        for line in llm_output.dialogue:
-            transcript_line = f"{line.speaker}: {line.text}"
-            voice = speaker_1_voice if line.speaker == "speaker-1" else speaker_2_voice
-            speaker_instructions=speaker_1_instructions if line.speaker == "speaker-1" else speaker_2_instructions
-            future = executor.submit(get_mp3, line.text, voice, audio_model, openai_api_key, speaker_instructions, )
-            futures.append((future, transcript_line))
-            characters += len(line.text)
-
-        for future, transcript_line in futures:
-            audio_chunk = future.result()
-            audio += audio_chunk
-            transcript += transcript_line + "\n\n"
-
-    logger.info(f"Generated {characters} characters of audio")
-
     temporary_directory = "./gradio_cached_examples/tmp/"
     os.makedirs(temporary_directory, exist_ok=True)
 
@@ -705,8 +683,34 @@ def generate_audio(
         delete=False,
         suffix=".mp3",
     )
-    temporary_file.write(audio)
-    temporary_file.close()
+
+    # Generate audio from the transcript, writing each line's audio to the file
+    # in order as it arrives rather than buffering the whole episode in memory
+    transcript = ""
+    characters = 0
+
+    try:
+        with temporary_file, cf.ThreadPoolExecutor() as executor:
+            futures = []
+            for line in llm_output.dialogue:
+                transcript_line = f"{line.speaker}: {line.text}"
+                voice = speaker_1_voice if line.speaker == "speaker-1" else speaker_2_voice
+                speaker_instructions=speaker_1_instructions if line.speaker == "speaker-1" else speaker_2_instructions
+                future = executor.submit(get_mp3, line.text, voice, audio_model, openai_api_key, speaker_instructions, )
+                futures.append((future, transcript_line))
+                characters += len(line.text)
+
+            for i, (future, transcript_line) in enumerate(futures):
+                temporary_file.write(future.result())
+                transcript += transcript_line + "\n\n"
+                # Drop the finished future so its audio can be freed
+                futures[i] = None
+    except Exception:
+        # Don't leave a truncated file behind if any line failed
+        os.remove(temporary_file.name)
+        raise
+
+    logger.info(f"Generated {characters} characters of audio")
 
     # Delete any files in the temp directory that end with .mp3 and are over a day old
     for file in glob.glob(f"{temporary_directory}*.mp3"):
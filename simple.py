@@ -1,30 +1,140 @@
 import os
 import io
 import re
+import shutil
+import subprocess
+import tempfile
+import time
 from pathlib import Path
 import textwrap
 import concurrent.futures
+import itertools
+import threading
+from collections import OrderedDict
 from tempfile import NamedTemporaryFile
 
+import blake3
 import gradio as gr
-from openai import OpenAI
-from pypdf import PdfReader
+import httpx
+import numpy as np
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+import pypdfium2 as pdfium
 from loguru import logger
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+try:
+    import pysbd
+except ImportError:  # fall back to splitting on ". " if pysbd is unavailable
+    pysbd = None
 
 # Maximum text length for OpenAI TTS API (4096 characters, but using 4000 to be safe)
 MAX_TTS_LENGTH = 4000
 
-def extract_text_from_pdf(file_path):
-    """Extract text from a PDF file with minimal processing"""
-    try:
-        reader = PdfReader(file_path)
-        text = ""
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n\n"
+# Number of TTS requests sent in parallel (and size of the shared connection pool).
+# Keep this within the concurrency allowed by your OpenAI rate limits.
+MAX_TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "16"))
+
+# On-disk cache of synthesized chunks, so repeated text isn't sent to the API again.
+# Least recently used files are removed once it grows past TTS_CACHE_MAX_BYTES.
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", Path.home() / ".cache" / "pdf2audio"))
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(1024 ** 3)))
+
+# Finished audio files handed to Gradio. Gradio copies them into its own cache,
+# so files here older than OUTPUT_MAX_AGE seconds are deleted.
+OUTPUT_DIR = Path(tempfile.gettempdir()) / "pdf2audio_output"
+OUTPUT_MAX_AGE = 24 * 60 * 60
+
+# Seconds to wait for ffmpeg to join the chunk files before falling back to
+# appending them; remuxing without re-encoding normally takes a few seconds
+FFMPEG_TIMEOUT = 120
+
+# Patterns removed by clean_text and their replacements. The rules are fused
+# into one alternation so the text is scanned once however many there are;
+# patterns must not contain capturing groups of their own. Line rules stop
+# before the newline that ends the line ((?=\n)) rather than consuming it, so
+# the next line can still match, e.g. a header line followed by a page number.
+_CLEAN_RULES = [
+    # Standalone page numbers (e.g., "42" on its own line)
+    (r'\n\s*\d+\s*(?=\n)', ''),
+    # Header/footer patterns such as "Journal | 2023"
+    (r'\n\s*[A-Za-z0-9_\-\.]+\s*\|\s*[A-Za-z0-9_\-\.]+\s*(?=\n)', ''),
+    # Multiple newlines
+    (r'\n{3,}', '\n\n'),
+]
+_CLEAN_RE = re.compile('|'.join(f'({pattern})' for pattern, _ in _CLEAN_RULES))
+# Replacement for each rule, indexed by its group number in _CLEAN_RE
+_CLEAN_REPLACEMENTS = [None] + [replacement for _, replacement in _CLEAN_RULES]
+
+def _clean_sub(match):
+    """Replacement for a _CLEAN_RE match"""
+    return _CLEAN_REPLACEMENTS[match.lastindex]
+
+# Fallback sentence boundary: a period followed by a space
+_SENT_SPLIT_RE = re.compile(r'(?<=\. )')
+
+# pySBD's cost per character grows with the length of its input, so long
+# paragraphs are segmented a window of about this many characters at a time
+_SEGMENT_WINDOW = 2000
+
+def split_sentences(paragraph):
+    """Split a paragraph into sentences, keeping abbreviations and decimals intact"""
+    if pysbd is None:
+        return _SENT_SPLIT_RE.split(paragraph)
+    
+    sentences = []
+    start = 0
+    while start < len(paragraph):
+        window = paragraph[start:start + _SEGMENT_WINDOW]
+        # A Segmenter keeps the text being split on the instance, so it can't be
+        # shared between concurrent conversions; creating one is cheap. The
+        # character spans are used to slice the original text, so the
+        # sentences join back to the paragraph exactly.
+        spans = pysbd.Segmenter(language="en", clean=False, char_span=True).segment(window)
+        # The window's last sentence may continue past its end, so it is left
+        # for the next window unless this is the end of the paragraph
+        ends = [span.end for span in spans[:-1] if 0 < span.end < len(window)]
+        if start + len(window) >= len(paragraph) or not ends:
+            ends.append(len(window))
         
-        return text
+        prev = 0
+        for end in ends:
+            sentences.append(window[prev:end])
+            prev = end
+        start += prev
+    return sentences
+
+def _page_text(pdf, page_index):
+    """Extract the text of one page, releasing the native page objects straight away"""
+    page = pdf[page_index]
+    textpage = page.get_textpage()
+    try:
+        # PDFium separates lines with "\r\n"; normalise so clean_text and the
+        # paragraph splitting see plain newlines
+        return textpage.get_text_range().replace("\r\n", "\n")
+    finally:
+        textpage.close()
+        page.close()
+
+def iter_pdf_pages(file_path):
+    """Yield the text of each page of a PDF file in order, as it is extracted"""
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for i in range(len(pdf)):
+                yield _page_text(pdf, i)
+        finally:
+            pdf.close()
     except Exception as e:
         logger.error(f"Error extracting text from PDF: {e}")
         raise
@@ -36,89 +146,289 @@ def clean_text(text):
     - Remove page numbers
     - Fix common formatting issues
     """
-    # Remove common page number patterns
-    text = re.sub(r'\n\s*\d+\s*\n', '\n', text)
-    
-    # Remove standalone page numbers (e.g., "42" on its own line)
-    text = re.sub(r'\n\s*\d+\s*\n', '\n', text)
-    
-    # Remove header/footer patterns if they appear on every page
-    text = re.sub(r'\n\s*[A-Za-z0-9_\-\.]+\s*\|\s*[A-Za-z0-9_\-\.]+\s*\n', '\n', text)
-    
-    # Fix multiple newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    return text
+    # Clean machine-generated text often has nothing to remove; search() stops
+    # at the first match, so skip the substitution (and its copy) when it can't apply
+    if not _CLEAN_RE.search(text):
+        return text
+    return _CLEAN_RE.sub(_clean_sub, text)
 
-def split_text_into_chunks(text, max_length=MAX_TTS_LENGTH):
+def clean_page(page_text):
     """
-    Split text into chunks that are small enough for the TTS API.
-    Try to split at paragraph or sentence boundaries where possible.
+    Clean the text of a single page so pages can be processed as they are
+    extracted. Returns the page followed by a paragraph break, so every page
+    boundary is a point where text can be split into chunks.
     """
-    # If text is already short enough, return it as a single chunk
-    if len(text) <= max_length:
-        return [text]
-    
-    chunks = []
+    # Pad the page with newlines so page numbers and headers on its first or
+    # last line are still matched, then add the page break outside the regex
+    # so a removed page number can't take it with it
+    cleaned = clean_text("\n" + page_text + "\n").strip()
+    return cleaned + "\n\n" if cleaned else ""
+
+def file_digest(file_path):
+    """Hash a file's contents with multithreaded BLAKE3 over a memory map"""
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(file_path)
+    return hasher.hexdigest()
+
+# Cleaned text of recently processed PDFs keyed by content hash, so that
+# regenerating the same document with another voice or model skips extraction.
+# Keyed on the hash rather than the path, since Gradio may reuse upload paths.
+TEXT_CACHE_SIZE = 32
+_text_cache = OrderedDict()
+_text_cache_lock = threading.Lock()
+
+def _get_cached_text(content_hash):
+    """Return the cleaned text cached for a PDF, or None"""
+    with _text_cache_lock:
+        if content_hash not in _text_cache:
+            return None
+        _text_cache.move_to_end(content_hash)
+        return _text_cache[content_hash]
+
+def _cache_text(content_hash, text):
+    """Remember the cleaned text of a PDF, evicting the least recently used entry"""
+    with _text_cache_lock:
+        _text_cache[content_hash] = text
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+
+def _paragraph_pieces(paragraph, max_length):
+    """
+    Break a paragraph into the pieces that chunks are built from, each ending
+    with its separator: the whole paragraph if it fits, otherwise its
+    sentences, and words for sentences that are still too long.
+    """
+    if len(paragraph) <= max_length:
+        return [paragraph + "\n\n"]
+    pieces = []
+    for sentence in split_sentences(paragraph):
+        if len(sentence) <= max_length:
+            pieces.append(sentence + " ")
+        else:
+            pieces.extend(word + " " for word in sentence.split(' '))
+    return pieces
+
+def _chunk_bounds(pieces, max_length):
+    """
+    Greedily pack consecutive pieces into chunks of at most max_length and
+    return the (start, stop) piece indices of each chunk.
+    """
+    # ends[i] is the length of pieces[0..i], so the end of each chunk is found
+    # with a binary search instead of summing lengths in Python
+    lengths = np.fromiter((len(piece) for piece in pieces), dtype=np.int64, count=len(pieces))
+    ends = np.cumsum(lengths)
     
-    # First try to split by paragraphs (double newlines)
-    paragraphs = text.split('\n\n')
+    bounds = []
+    start = 0
+    while start < len(pieces):
+        offset = ends[start - 1] if start else 0
+        stop = int(np.searchsorted(ends, offset + max_length, side='right'))
+        # A piece longer than max_length on its own becomes its own chunk
+        stop = max(stop, start + 1)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+def iter_text_chunks(fragments, max_length=MAX_TTS_LENGTH):
+    """
+    Split text arriving in consecutive fragments (e.g. pages) into chunks that
+    are small enough for the TTS API, yielding each chunk as soon as no later
+    text can be added to it. The chunks are the same as those produced for the
+    concatenated text.
+    """
+    # Text after the last paragraph break seen so far, which may continue in
+    # the next fragment
+    carry = ""
+    # Pieces of complete paragraphs not yet emitted as part of a chunk
+    pending = []
+    pending_len = 0
     
-    current_chunk = ""
-    for paragraph in paragraphs:
-        # If adding this paragraph would exceed the limit, save current chunk and start a new one
-        if len(current_chunk) + len(paragraph) + 2 > max_length:
-            # If current paragraph is too long by itself, split by sentences
-            if len(paragraph) > max_length:
-                # Try to split by sentences (period followed by space)
-                sentences = re.split(r'(?<=\. )', paragraph)
-                
-                # Add sentences to current chunk until it's full
-                for sentence in sentences:
-                    if len(current_chunk) + len(sentence) + 1 > max_length:
-                        # If current sentence is still too long, split by words
-                        if len(sentence) > max_length:
-                            words = sentence.split(' ')
-                            for word in words:
-                                if len(current_chunk) + len(word) + 1 > max_length:
-                                    chunks.append(current_chunk.strip())
-                                    current_chunk = word + " "
-                                else:
-                                    current_chunk += word + " "
-                        else:
-                            # Add chunk and start new one with this sentence
-                            chunks.append(current_chunk.strip())
-                            current_chunk = sentence + " "
-                    else:
-                        current_chunk += sentence + " "
-            else:
-                # Add chunk and start new one with this paragraph
-                chunks.append(current_chunk.strip())
-                current_chunk = paragraph + "\n\n"
-        else:
-            current_chunk += paragraph + "\n\n"
+    for fragment in fragments:
+        paragraphs = (carry + fragment).split('\n\n')
+        carry = paragraphs.pop()
+        for paragraph in paragraphs:
+            pieces = _paragraph_pieces(paragraph, max_length)
+            pending += pieces
+            pending_len += sum(len(piece) for piece in pieces)
+        
+        # Once more than a chunk's worth is pending, every chunk but the last
+        # is complete; the last may still take pieces from the next fragment
+        if pending_len > max_length:
+            bounds = _chunk_bounds(pending, max_length)
+            for start, stop in bounds[:-1]:
+                chunk = "".join(pending[start:stop]).strip()
+                if chunk:
+                    yield chunk
+            pending = pending[bounds[-1][0]:]
+            pending_len = sum(len(piece) for piece in pending)
     
-    # Add the final chunk if there's anything left
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
+    pending += _paragraph_pieces(carry, max_length)
+    for start, stop in _chunk_bounds(pending, max_length):
+        chunk = "".join(pending[start:stop]).strip()
+        if chunk:
+            yield chunk
+
+def create_client(api_key):
+    """Create an OpenAI client whose connection pool is shared by all chunk requests"""
+    return OpenAI(
+        api_key=api_key,
+        # Retries are handled by the tenacity policy on _request_speech;
+        # don't stack the SDK's own retries on top
+        max_retries=0,
+        http_client=httpx.Client(
+            limits=httpx.Limits(
+                max_connections=MAX_TTS_CONCURRENCY,
+                max_keepalive_connections=MAX_TTS_CONCURRENCY,
+            )
+        ),
+    )
+
+def _tts_cache_path(text, voice, model):
+    """Location of the cached audio for a chunk of text with the given voice and model"""
+    key = blake3.blake3(f"{model}\n{voice}\n{text}".encode()).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.mp3"
+
+def prune_tts_cache(max_bytes=TTS_CACHE_MAX_BYTES):
+    """Delete the least recently used cached chunks until the cache fits in max_bytes"""
+    entries = []
+    for path in TTS_CACHE_DIR.glob("*.mp3"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
     
-    return chunks
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError as e:
+            logger.warning(f"Failed to remove cached audio {path}: {e}")
+
+def _log_retry(retry_state):
+    """Log a failed TTS request that is about to be retried"""
+    logger.warning(
+        f"TTS request failed (attempt {retry_state.attempt_number}), retrying: "
+        f"{retry_state.outcome.exception()}"
+    )
 
-def generate_audio_chunk(text, api_key, voice="alloy", model="tts-1"):
-    """Generate audio for a single chunk of text"""
-    client = OpenAI(api_key=api_key)
+@retry(
+    # Rate limits and transient server or network errors, as the SDK's own
+    # retry policy would cover
+    retry=retry_if_exception_type(
+        (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+    ),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    before_sleep=_log_retry,
+    reraise=True,
+)
+def _request_speech(text, client, voice, model):
+    """Request audio for a chunk of text from the TTS API"""
+    return client.audio.speech.create(
+        model=model,
+        voice=voice,
+        input=text
+    )
+
+def generate_audio_chunk(text, client, voice="alloy", model="tts-1"):
+    """Generate audio for a single chunk of text, reusing cached audio when available"""
+    cache_path = _tts_cache_path(text, voice, model)
+    try:
+        audio = cache_path.read_bytes()
+    except OSError:
+        pass
+    else:
+        # Mark the entry as recently used for prune_tts_cache; a failure here
+        # (e.g. a read-only cache) must not discard the audio already read
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return audio
     
     try:
-        response = client.audio.speech.create(
-            model=model,
-            voice=voice,
-            input=text
-        )
-        
-        return response.content
+        response = _request_speech(text, client, voice, model)
     except Exception as e:
         logger.error(f"Error generating audio for chunk: {e}")
         raise
+    
+    # Write under a temporary name and rename, so concurrent readers never see
+    # a partial file; a failed write only costs the cache entry
+    tmp_path = None
+    try:
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=TTS_CACHE_DIR, suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            f.write(response.content)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to cache audio for chunk: {e}")
+        # prune_tts_cache only sweeps .mp3 files, so don't leave the temp file behind
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    return response.content
+
+def new_output_path():
+    """
+    Create an empty per-request output file in OUTPUT_DIR and return its path,
+    deleting any files there that are over a day old
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for path in OUTPUT_DIR.glob("*.mp3"):
+        try:
+            if time.time() - path.stat().st_mtime > OUTPUT_MAX_AGE:
+                path.unlink()
+        except OSError as e:
+            logger.warning(f"Failed to remove old audio file {path}: {e}")
+    
+    with NamedTemporaryFile(dir=OUTPUT_DIR, prefix="pdf2audio_", suffix=".mp3", delete=False) as f:
+        return f.name
+
+def concatenate_audio(chunk_files, output_path):
+    """
+    Join MP3 chunk files, in order, into a single file at output_path.
+    Uses ffmpeg's concat demuxer when it is installed, which remuxes the
+    chunks into one valid stream without re-encoding; otherwise the raw
+    bytes are appended, which most players tolerate.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        # The list file sits next to the chunks so it is removed with them
+        list_path = os.path.join(os.path.dirname(chunk_files[0]), "chunks.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            for chunk_file in chunk_files:
+                name = os.path.basename(chunk_file).replace("'", "'\\''")
+                f.write(f"file '{name}'\n")
+        try:
+            # ffmpeg must not read the server's terminal, which could hang the
+            # request (or stop a backgrounded server with SIGTTIN)
+            subprocess.run(
+                [ffmpeg, "-nostdin", "-y", "-loglevel", "error",
+                 "-f", "concat", "-safe", "0", "-i", list_path,
+                 "-c", "copy", output_path],
+                stdin=subprocess.DEVNULL,
+                check=True,
+                capture_output=True,
+                timeout=FFMPEG_TIMEOUT,
+            )
+            return
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"ffmpeg concat failed, appending chunks instead: {e.stderr.decode(errors='replace')}")
+        except subprocess.TimeoutExpired:
+            logger.warning(f"ffmpeg concat timed out after {FFMPEG_TIMEOUT}s, appending chunks instead")
+    
+    with open(output_path, "wb") as outfile:
+        for chunk_file in chunk_files:
+            with open(chunk_file, "rb") as infile:
+                shutil.copyfileobj(infile, outfile, length=1024 * 1024)
 
 def process_pdf(pdf_file, api_key, voice, tts_model):
     """Process the PDF and generate audio"""
@@ -126,84 +436,120 @@ def process_pdf(pdf_file, api_key, voice, tts_model):
         return None, "OpenAI API key is required", None
     
     try:
-        # Extract text from PDF
-        logger.info("Extracting text from PDF")
-        text = extract_text_from_pdf(pdf_file.name)
+        content_hash = file_digest(pdf_file.name)
+        cached_text = _get_cached_text(content_hash)
+        cleaned_pages = []
         
-        # Clean the text (minimal processing)
-        logger.info("Cleaning text")
-        cleaned_text = clean_text(text)
+        if cached_text is not None:
+            logger.info("Reusing text extracted from this PDF in an earlier run")
+            # Split the same way as a first run so chunks, and their cached
+            # audio, match exactly
+            chunks = iter_text_chunks([cached_text])
+        else:
+            # Extract and clean the text (minimal processing) page by page and
+            # split it into chunks as it arrives, so the first chunks are sent
+            # for synthesis while later pages are still being extracted
+            logger.info("Extracting text from PDF")
+            
+            def clean_pages():
+                for page_text in iter_pdf_pages(pdf_file.name):
+                    cleaned = clean_page(page_text)
+                    if cleaned:
+                        cleaned_pages.append(cleaned)
+                        yield cleaned
+            
+            chunks = iter_text_chunks(clean_pages())
         
-        # Split text into chunks
-        logger.info("Splitting text into chunks")
-        chunks = split_text_into_chunks(cleaned_text)
-        logger.info(f"Text split into {len(chunks)} chunks")
+        def full_text():
+            """Cleaned text of the whole document, once every chunk has been produced"""
+            if cached_text is not None:
+                return cached_text
+            text = "".join(cleaned_pages)
+            _cache_text(content_hash, text)
+            return text
+        
+        # Keep the audio cache within its size limit
+        prune_tts_cache()
         
         # Generate audio for each chunk in parallel
         logger.info(f"Generating audio with voice '{voice}' using model '{tts_model}'")
         
-        # Create a temporary directory for audio chunks
-        temp_dir = "./temp_audio_chunks"
+        # A document that fits in a single request needs no chunk directory,
+        # thread pool or concatenation step
+        first_chunk = next(chunks, None)
+        second_chunk = next(chunks, None)
+        if second_chunk is None:
+            cleaned_text = full_text()
+            if not first_chunk:
+                return None, "No text could be extracted from the PDF", cleaned_text
+            with create_client(api_key) as client:
+                chunk_audio = generate_audio_chunk(first_chunk, client, voice, tts_model)
+            temp_audio_path = new_output_path()
+            Path(temp_audio_path).write_bytes(chunk_audio)
+            return temp_audio_path, None, cleaned_text
+        
+        # Create a private temporary directory for this request's audio chunks
         try:
-            os.makedirs(temp_dir, exist_ok=True)
+            temp_dir = tempfile.mkdtemp(prefix="pdf2audio_")
             logger.info(f"Created temporary directory: {temp_dir}")
         except Exception as e:
             logger.error(f"Failed to create temporary directory: {e}")
             raise
         
-        # Process chunks and save to individual files to maintain order
-        chunk_files = []
-        
-        def process_and_save_chunk(chunk_index, chunk_text):
-            """Process a chunk and save to a temporary file with ordered name"""
-            try:
-                chunk_audio = generate_audio_chunk(chunk_text, api_key, voice, tts_model)
-                # Create a temporary file with ordered naming
-                chunk_filename = os.path.join(temp_dir, f"chunk_{chunk_index:04d}.mp3")
-                with open(chunk_filename, "wb") as f:
-                    f.write(chunk_audio)
-                logger.info(f"Processed chunk {chunk_index+1}/{len(chunks)}")
-                return chunk_filename
-            except Exception as e:
-                logger.error(f"Error processing chunk {chunk_index+1}: {e}")
-                raise
-        
-        # Use ThreadPoolExecutor for parallel processing, but ensure proper ordering
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            # Submit all tasks with their indices
-            future_to_index = {}
-            for i, chunk in enumerate(chunks):
-                future = executor.submit(process_and_save_chunk, i, chunk)
-                future_to_index[future] = i
+        try:
+            # Process chunks and save to individual files to maintain order
+            chunk_files = []
             
-            # Process results and collect filenames in order
-            chunk_files = [None] * len(chunks)
-            for future in concurrent.futures.as_completed(future_to_index):
-                index = future_to_index[future]
+            def process_and_save_chunk(chunk_index, chunk_text):
+                """Process a chunk and save to a temporary file with ordered name"""
                 try:
-                    filename = future.result()
-                    chunk_files[index] = filename
+                    chunk_audio = generate_audio_chunk(chunk_text, client, voice, tts_model)
+                    # Create a temporary file with ordered naming
+                    chunk_filename = os.path.join(temp_dir, f"chunk_{chunk_index:04d}.mp3")
+                    with open(chunk_filename, "wb") as f:
+                        f.write(chunk_audio)
+                    logger.info(f"Processed chunk {chunk_index+1}")
+                    return chunk_filename
                 except Exception as e:
-                    logger.error(f"Error processing chunk {index+1}: {e}")
+                    logger.error(f"Error processing chunk {chunk_index+1}: {e}")
                     raise
-        
-        # Combine audio files in correct order
-        temp_audio_path = "temp_audio.mp3"
-        with open(temp_audio_path, "wb") as outfile:
+            
+            # Use ThreadPoolExecutor for parallel processing, but ensure proper ordering.
+            # All chunks share one client so connections are reused between requests.
+            with create_client(api_key) as client, concurrent.futures.ThreadPoolExecutor(
+                max_workers=MAX_TTS_CONCURRENCY
+            ) as executor:
+                # Submit each chunk with its index as soon as it is produced
+                future_to_index = {}
+                for i, chunk in enumerate(itertools.chain((first_chunk, second_chunk), chunks)):
+                    future = executor.submit(process_and_save_chunk, i, chunk)
+                    future_to_index[future] = i
+                cleaned_text = full_text()
+                logger.info(f"Text split into {len(future_to_index)} chunks")
+                
+                # Process results and collect filenames in order
+                chunk_files = [None] * len(future_to_index)
+                for future in concurrent.futures.as_completed(future_to_index):
+                    index = future_to_index[future]
+                    try:
+                        filename = future.result()
+                        chunk_files[index] = filename
+                    except Exception as e:
+                        logger.error(f"Error processing chunk {index+1}: {e}")
+                        raise
+            
+            # Combine audio files in correct order into a per-request output file,
+            # so concurrent conversions don't overwrite each other's audio
+            temp_audio_path = new_output_path()
             # Ensure we process in index order
-            for chunk_file in chunk_files:
-                if chunk_file and os.path.exists(chunk_file):
-                    with open(chunk_file, "rb") as infile:
-                        outfile.write(infile.read())
-        
-        # Clean up temporary chunk files
-        logger.info("Cleaning up temporary audio chunk files")
-        for chunk_file in chunk_files:
-            if chunk_file and os.path.exists(chunk_file):
-                try:
-                    os.remove(chunk_file)
-                except Exception as e:
-                    logger.warning(f"Failed to remove temporary file {chunk_file}: {e}")
+            concatenate_audio(
+                [chunk_file for chunk_file in chunk_files if chunk_file and os.path.exists(chunk_file)],
+                temp_audio_path,
+            )
+        finally:
+            # The directory only holds this request's chunks, so remove it in one go
+            logger.info("Cleaning up temporary audio chunk files")
+            shutil.rmtree(temp_dir, ignore_errors=True)
         
         return temp_audio_path, None, cleaned_text
     